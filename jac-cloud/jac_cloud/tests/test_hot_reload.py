@@ -3,7 +3,7 @@
 from contextlib import suppress
 from os import makedirs, rmdir, unlink
 from pathlib import Path
-from subprocess import Popen, run
+from subprocess import Popen
 from time import sleep
 from unittest import TestCase
 
@@ -11,13 +11,15 @@ from httpx import get
 
 from yaml import safe_load
 
+from .test_utils import get_free_port, stop_process_group
+
 
 class HotReloadTest(TestCase):
     """Test Utils."""
 
     def test_hot_reload(self) -> None:
         """Run server."""
-        run(["fuser", "-k", "8001/tcp"])
+        port = get_free_port()
         self.directory = Path(__file__).parent
         open(f"{self.directory}/test.jac", "w").close()
         server = Popen(
@@ -26,13 +28,14 @@ class HotReloadTest(TestCase):
                 "serve",
                 f"{self.directory}/test.jac",
                 "--port",
-                "8001",
+                f"{port}",
                 "--reload",
-            ]
+            ],
+            start_new_session=True,
         )
 
         try:
-            self.host = "http://localhost:8001"
+            self.host = f"http://localhost:{port}"
 
             self.check_server_loop()
 
@@ -53,14 +56,12 @@ class HotReloadTest(TestCase):
             with open(f"{self.directory}/clean_openapi_specs.yaml") as file:
                 self.assertNotEqual(safe_load(file), safe_load(res.text))
         finally:
-            server.kill()
-            server.wait()
+            stop_process_group(server)
             unlink(f"{self.directory}/test.jac")
-            run(["fuser", "-k", "8001/tcp"])
 
     def test_hot_reload_with_watch(self) -> None:
         """Run server."""
-        run(["fuser", "-k", "8001/tcp"])
+        port = get_free_port()
         self.directory = Path(__file__).parent
 
         makedirs(f"{self.directory}/dir")
@@ -71,15 +72,16 @@ class HotReloadTest(TestCase):
                 "serve",
                 f"{self.directory}/test.jac",
                 "--port",
-                "8001",
+                f"{port}",
                 "--reload",
                 "--watch",
                 f"{self.directory}/dir",
-            ]
+            ],
+            start_new_session=True,
         )
 
         try:
-            self.host = "http://localhost:8001"
+            self.host = f"http://localhost:{port}"
 
             self.check_server_loop()
 
@@ -107,12 +109,10 @@ class HotReloadTest(TestCase):
             with open(f"{self.directory}/clean_openapi_specs.yaml") as file:
                 self.assertNotEqual(safe_load(file), safe_load(res.text))
         finally:
-            server.kill()
-            server.wait()
+            stop_process_group(server)
             unlink(f"{self.directory}/test.jac")
             unlink(f"{self.directory}/dir/test.jac")
             rmdir(f"{self.directory}/dir")
-            run(["fuser", "-k", "8001/tcp"])
 
     def check_server_loop(self) -> None:
         """Check server test."""
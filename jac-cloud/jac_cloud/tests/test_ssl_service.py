@@ -3,7 +3,7 @@
 from contextlib import suppress
 from os import environ
 from pathlib import Path
-from subprocess import Popen, run
+from subprocess import Popen
 from time import sleep
 from unittest import TestCase
 
@@ -11,13 +11,15 @@ from httpx import get
 
 from yaml import safe_load
 
+from .test_utils import get_free_port, stop_process_group
+
 
 class SSLServiceTest(TestCase):
     """Test Utils."""
 
     def test_ssl_service(self) -> None:
         """Run server."""
-        run(["fuser", "-k", "8443/tcp"])
+        port = get_free_port()
 
         self.directory = Path(__file__).parent
 
@@ -26,12 +28,13 @@ class SSLServiceTest(TestCase):
         env["UV_SSL_KEYFILE"] = f"{self.directory}/localhost.key"
 
         server = Popen(
-            ["jac", "serve", f"{self.directory}/simple_graph.jac", "--port", "8443"],
+            ["jac", "serve", f"{self.directory}/simple_graph.jac", "--port", f"{port}"],
             env=env,
+            start_new_session=True,
         )
 
         try:
-            self.host = "https://localhost:8443"
+            self.host = f"https://localhost:{port}"
 
             count = 0
             while True:
@@ -51,9 +54,7 @@ class SSLServiceTest(TestCase):
             with open(f"{self.directory}/openapi_specs.yaml") as file:
                 self.assertEqual(safe_load(file), safe_load(res.text))
         finally:
-            server.kill()
-            server.wait()
-            run(["fuser", "-k", "8443/tcp"])
+            stop_process_group(server)
 
     def check_server(self) -> None:
         """Retrieve OpenAPI Specs JSON."""
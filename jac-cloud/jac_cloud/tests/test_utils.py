@@ -1,8 +1,10 @@
 """Test utils."""
 
 from contextlib import suppress
-from os import environ, getenv
-from subprocess import Popen, run
+from os import environ, getenv, getpgid, killpg
+from signal import SIGKILL, SIGTERM
+from socket import AF_INET, SOCK_STREAM, socket
+from subprocess import Popen, TimeoutExpired, run
 from time import sleep
 from typing import Literal, overload
 from unittest import TestCase
@@ -18,6 +20,24 @@ from redis import Redis as RedisClient
 from ..jaseci.datasources import Collection, MontyClient, Redis
 
 
+def get_free_port() -> int:
+    """Get a free port by binding to port 0 and releasing it."""
+    with socket(AF_INET, SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def stop_process_group(proc: Popen) -> None:
+    """Stop a server started with start_new_session, including its workers."""
+    pgid = getpgid(proc.pid)
+    killpg(pgid, SIGTERM)
+    try:
+        proc.wait(timeout=5)
+    except TimeoutExpired:
+        killpg(pgid, SIGKILL)
+        proc.wait()
+
+
 class JacCloudTest(TestCase):
     """Test Utils."""
 
@@ -30,13 +50,16 @@ class JacCloudTest(TestCase):
     def run_server(
         cls,
         file: str,
-        port: int = 8000,
+        port: int | None = None,
         database: str = "jaseci",
         envs: dict | None = None,
         wait: int = 10,
     ) -> None:
         """Run server."""
-        run(["fuser", "-k", f"{port}/tcp"])
+        if port is None:
+            port = get_free_port()
+        else:
+            run(["fuser", "-k", f"{port}/tcp"])
 
         base_envs = environ.copy()
         base_envs["DATABASE_NAME"] = database
@@ -45,7 +68,9 @@ class JacCloudTest(TestCase):
             base_envs.update(envs)
 
         cls.server = Popen(
-            ["jac", "serve", f"{file}", "--port", f"{port}"], env=base_envs
+            ["jac", "serve", f"{file}", "--port", f"{port}"],
+            env=base_envs,
+            start_new_session=True,
         )
 
         cls.host = f"http://localhost:{port}"
@@ -67,7 +92,7 @@ class JacCloudTest(TestCase):
     @classmethod
     def stop_server(cls) -> None:
         """Stop server."""
-        cls.server.kill()
+        stop_process_group(cls.server)
 
     @classmethod
     def check_server(cls) -> None:
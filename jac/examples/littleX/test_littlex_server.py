@@ -23,6 +23,27 @@ def get_free_port() -> int:
     return port
 
 
+def wait_for_port(host: str, port: int, timeout: float = 10.0) -> None:
+    """Wait until a server accepts TCP connections, backing off exponentially."""
+    deadline = time.time() + timeout
+    delay = 0.005
+    last_err: OSError | None = None
+    while (remaining := deadline - time.time()) > 0:
+        # Keep each attempt short so a stalled handshake falls through to the
+        # backoff; only the final attempt may use whatever budget is left.
+        attempt_timeout = remaining if remaining <= delay else min(delay, 0.05)
+        try:
+            socket.create_connection((host, port), timeout=attempt_timeout).close()
+            return
+        except OSError as exc:
+            last_err = exc
+        time.sleep(min(delay, max(deadline - time.time(), 0)))
+        delay = min(delay * 2, 0.2)
+    raise TimeoutError(
+        f"Server on {host}:{port} not ready after {timeout}s"
+    ) from last_err
+
+
 class _User(TypedDict):
     password: str
     token: str
@@ -117,13 +138,7 @@ class TestLittleXServer:
         self.server_thread.start()
 
         # Wait for server to be ready
-        max_attempts = 50
-        for _ in range(max_attempts):
-            try:
-                self._request("GET", "/")
-                break
-            except Exception:
-                time.sleep(0.1)
+        wait_for_port("127.0.0.1", self.port)
 
     def _request(
         self, method: str, path: str, data: dict | None = None, token: str | None = None